@@ -1,79 +1,473 @@
 import asyncio
+import atexit
+import bisect
+import itertools
 import json
 import os
-import uuid
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 from mcp.server.fastmcp import FastMCP
 
-mcp = FastMCP("Memory Service")
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+@asynccontextmanager
+async def server_lifespan(server):
+    """Run the background memory flusher while the server is up"""
+    flush_task = asyncio.create_task(_flush_loop())
+    try:
+        yield
+    finally:
+        flush_task.cancel()
+        flush_memory(force_durable=True)
+
+mcp = FastMCP("Memory Service", lifespan=server_lifespan)
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 MEMORY_FILE = os.path.join(SCRIPT_DIR, "memory_data.json")
+MEMORY_JOURNAL = os.path.join(SCRIPT_DIR, "memory_journal.jsonl")
+MEMORY_JOURNAL_OLD = MEMORY_JOURNAL + ".old"  # Journal being folded into the snapshot
 LOG_FILE = os.path.join(SCRIPT_DIR, "memory_operations.log")
+FLUSH_INTERVAL = 0.1  # Seconds between background flushes
+FLUSH_MAX_PENDING = 50  # Wake the flusher early once this many mutations are unsaved
+FSYNC_INTERVAL = 1.0  # Seconds between fsyncs of flushed journal records
+JOURNAL_COMPACT_LINES = 1000  # Minimum journal length before the snapshot is rewritten
+COMPACT_RETRY_INTERVAL = 30.0  # Seconds to wait after a failed compaction
+KEY_PREVIEW_LIMIT = 10  # Keys listed when a lookup misses
+LOG_QUEUE_SIZE = 4096  # Log entries waiting for the writer thread before new ones are dropped
+LOG_BATCH_SIZE = 64  # Log entries encoded and written together
 
 memory_store = {}
+_sorted_index = []  # (created_at, seq, key), oldest first; seq orders same-second entries
+_entry_info = {}  # key -> (created_date, created_time, content_len); derived, never persisted
+_index_seq = itertools.count()
+_pending_mutations = 0
+_journal_lines = 0
+_flush_wakeup = asyncio.Event()
+_pid = os.getpid()
+_op_counter = itertools.count()  # Operation ids are "<pid>-<n>", unique per process run
+_last_sec = 0  # now_iso cache: the second last formatted and its ISO string
+_last_iso = ''
+_KEY_STAMP_TABLE = str.maketrans('', '', '-T:')  # "2025-07-24T22:53:17" -> "20250724225317"
+
+_IOV_MAX = os.sysconf('SC_IOV_MAX') if hasattr(os, 'sysconf') else -1
+if _IOV_MAX <= 0:
+    _IOV_MAX = 1024  # sysconf reports -1 when there is no fixed limit
+
+class AppendFile:
+    """Append-only file that queues records and writes them in one writev per flush"""
+
+    def __init__(self, path: str):
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+        self.fd = os.open(path, flags, 0o644)
+        self.pending = deque()  # append/popleft are atomic, so no lock on the write side
+        self.lock = threading.Lock()  # Keeps concurrent flushes from reordering records
+
+    def write(self, data: bytes):
+        self.pending.append(data)
+
+    def flush(self):
+        with self.lock:
+            while self.pending:
+                count = min(len(self.pending), _IOV_MAX)
+                self._write_all([self.pending.popleft() for _ in range(count)])
+
+    def _write_all(self, buffers: list):
+        # On failure, put back whatever didn't reach the file so the next flush retries it
+        try:
+            written = os.writev(self.fd, buffers) if hasattr(os, 'writev') else 0
+        except OSError:
+            self.pending.extendleft(reversed(buffers))
+            raise
+        if written < sum(map(len, buffers)):
+            # Short writes are rare for regular files; finish with plain writes
+            rest = memoryview(b''.join(buffers))[written:]
+            while rest:
+                try:
+                    rest = rest[os.write(self.fd, rest):]
+                except OSError:
+                    self.pending.appendleft(bytes(rest))
+                    raise
+
+    def sync(self):
+        os.fsync(self.fd)
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            os.close(self.fd)
+
+def trim_torn_tail(path: str):
+    """Cut an unterminated last line left by a crash, so the next append starts a fresh line"""
+    if not os.path.exists(path):
+        return
+    with open(path, 'r+b') as f:
+        end = f.seek(0, os.SEEK_END)
+        if end == 0:
+            return
+        f.seek(end - 1)
+        if f.read(1) == b'\n':
+            return
+        pos = end
+        while pos > 0:
+            start = max(0, pos - 4096)
+            f.seek(start)
+            newline = f.read(pos - start).rfind(b'\n')
+            if newline != -1:
+                f.truncate(start + newline + 1)
+                return
+            pos = start
+        f.truncate(0)
+
+# Journal records are handed to the kernel in batches by the flush loop, from a
+# worker thread; log entries are encoded and written by their own writer thread
+trim_torn_tail(MEMORY_JOURNAL)
+trim_torn_tail(LOG_FILE)
+_JOURNAL_FH = AppendFile(MEMORY_JOURNAL)
+_LOG_FH = AppendFile(LOG_FILE)
+atexit.register(_LOG_FH.close)
+_log_q = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+
+def dumps_json(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def loads_json(data: bytes):
+    """Parse UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 def load_memory_from_file():
-    """Load memory data from JSON file"""
+    """Load memory data from JSON snapshot and replay the journal on top"""
     global memory_store
     try:
-        if os.path.exists(MEMORY_FILE):
-            with open(MEMORY_FILE, 'r', encoding='utf-8') as f:
-                memory_store = json.load(f)
+        snapshot_exists = os.path.exists(MEMORY_FILE)
+        memory_store = {}
+        if snapshot_exists:
+            with open(MEMORY_FILE, 'rb') as f:
+                memory_store = loads_json(f.read())
+        replay_journal()
+        for entry in memory_store.values():
+            normalize_entry(entry)
+        if snapshot_exists or memory_store:
             print(f"Loaded {len(memory_store)} memory entries.")
         else:
-            memory_store = {}
             print("Created new memory store.")
     except Exception as e:
         print("Failed to load memory file.")
         memory_store = {}
+    rebuild_sorted_index()
+    _entry_info.clear()
+    for key, entry in memory_store.items():
+        cache_entry_info(key, entry)
+
+def rebuild_sorted_index():
+    """Rebuild the created_at index from memory_store, which is in creation order"""
+    global _index_seq
+    _sorted_index[:] = sorted(
+        (entry["created_at"], seq, key) for seq, (key, entry) in enumerate(memory_store.items())
+    )
+    _index_seq = itertools.count(len(_sorted_index))
 
-def save_memory_to_file():
-    """Save memory data to JSON file"""
+def index_add(key: str, entry: dict):
+    """Insert an entry into the created_at index"""
+    bisect.insort(_sorted_index, (entry["created_at"], next(_index_seq), key))
+
+def index_remove(key: str, entry: dict):
+    """Remove an entry from the created_at index"""
+    created_at = entry["created_at"]
+    i = bisect.bisect_left(_sorted_index, (created_at,))
+    while i < len(_sorted_index) and _sorted_index[i][0] == created_at:
+        if _sorted_index[i][2] == key:
+            del _sorted_index[i]
+            return
+        i += 1
+
+def replay_journal():
+    """Apply journaled mutations to memory_store"""
+    global _journal_lines
+    # A leftover rotated journal holds older records than the live one
+    for path in (MEMORY_JOURNAL_OLD, MEMORY_JOURNAL):
+        if not os.path.exists(path):
+            continue
+        with open(path, 'rb') as f:
+            for line in f:
+                try:
+                    record = loads_json(line)
+                except ValueError:
+                    continue  # Torn last line from an interrupted write
+                if record["op"] == "delete":
+                    memory_store.pop(record["key"], None)
+                else:
+                    memory_store[record["key"]] = record["entry"]
+                _journal_lines += 1
+
+def fsync_dir(path: str):
+    """fsync a directory so renames and new files in it are durable"""
+    if os.name != 'posix':
+        return  # Directories can't be opened for fsync on Windows
+    fd = os.open(path, os.O_RDONLY)
     try:
-        with open(MEMORY_FILE, 'w', encoding='utf-8') as f:
-            json.dump(memory_store, f, ensure_ascii=False, indent=2)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def save_memory_to_file(data: bytes):
+    """Durably save serialized memory data to JSON file via a temp file and atomic rename"""
+    try:
+        tmp_file = MEMORY_FILE + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, MEMORY_FILE)
+        fsync_dir(SCRIPT_DIR)
         return True
     except Exception:
         print("Failed to save memory file.")
         return False
 
-def generate_auto_key():
-    """Generate auto key from current time"""
-    now = datetime.now()
-    return f"memory_{now.strftime('%Y%m%d%H%M%S')}"
+def append_journal(op: str, key: str, entry: dict = None):
+    """Append one create/update/delete to the journal"""
+    global _journal_lines
+    record = {"op": op, "key": key, "entry": entry}
+    _JOURNAL_FH.write(dumps_json(record) + b'\n')
+    _journal_lines += 1
+    mark_dirty()
+
+def take_over_journal(old_fh: AppendFile) -> AppendFile:
+    """Open MEMORY_JOURNAL for appending, moving over old_fh's queued records"""
+    # Queued records are newer than everything old_fh wrote, so they keep replay
+    # order and never have to be written through the retired handle
+    fh = AppendFile(MEMORY_JOURNAL)
+    fh.pending.extend(old_fh.pending)
+    old_fh.pending.clear()
+    return fh
+
+async def compact_journal() -> bool:
+    """Fold the journal into a fresh snapshot without blocking the event loop"""
+    global _JOURNAL_FH, _journal_lines
+    # A rotated journal left by a failed save or a crash has to be folded in
+    # before the live journal can take its place
+    if os.path.exists(MEMORY_JOURNAL_OLD):
+        if not await asyncio.to_thread(save_memory_to_file, dumps_json(memory_store)):
+            return False
+        os.remove(MEMORY_JOURNAL_OLD)
+    # Move the journal aside so records appended during the write land in a new
+    # file. Replay is idempotent, so a crash at any point here loses nothing.
+    await asyncio.to_thread(_JOURNAL_FH.flush)
+    old_fh = _JOURNAL_FH
+    if os.name != 'posix':
+        os.close(old_fh.fd)  # Windows can't rename a file that is still open
+    try:
+        os.replace(MEMORY_JOURNAL, MEMORY_JOURNAL_OLD)
+    except OSError:
+        # On POSIX the handle was never closed and stays in use
+        if os.name != 'posix':
+            _JOURNAL_FH = take_over_journal(old_fh)
+        raise
+    _JOURNAL_FH = take_over_journal(old_fh)
+    _journal_lines = len(_JOURNAL_FH.pending)
+    # Serialize on the loop; memory_store may change while the write runs
+    data = dumps_json(memory_store)
+    if os.name == 'posix':
+        try:
+            await asyncio.to_thread(os.close, old_fh.fd)
+        except OSError as e:
+            print(f"Failed to close rotated memory journal: {str(e)}")
+    # The snapshot is fsynced before this returns, so the old journal can go
+    if not await asyncio.to_thread(save_memory_to_file, data):
+        return False
+    os.remove(MEMORY_JOURNAL_OLD)
+    return True
+
+def compaction_due():
+    """Whether the journal has outgrown the snapshot it would be folded into"""
+    # Scaling the threshold with the store keeps the O(N) snapshot rewrite at
+    # amortized O(1) per mutation, and bounds replay time by the store size
+    return _journal_lines >= max(JOURNAL_COMPACT_LINES, len(memory_store))
+
+def mark_dirty():
+    """Record an unsaved mutation, waking the flusher if too many pile up"""
+    global _pending_mutations
+    _pending_mutations += 1
+    if _pending_mutations >= FLUSH_MAX_PENDING:
+        _flush_wakeup.set()
+
+def flush_memory(force_durable: bool = False):
+    """Write buffered journal records to disk, optionally fsyncing them"""
+    try:
+        _JOURNAL_FH.flush()
+        if force_durable:
+            _JOURNAL_FH.sync()
+            fsync_dir(SCRIPT_DIR)
+        return True
+    except Exception as e:
+        print(f"Failed to flush memory files: {str(e)}")
+        return False
+
+async def _flush_loop():
+    """Coalesce writes into one flush per interval, run in a worker thread"""
+    global _pending_mutations
+    unsynced = False
+    last_sync = time.monotonic()
+    next_compact = 0.0  # Holds off retries so a failing save doesn't run every pass
+    while True:
+        try:
+            await asyncio.wait_for(_flush_wakeup.wait(), FLUSH_INTERVAL)
+        except TimeoutError:
+            pass
+        _flush_wakeup.clear()
+        unsynced = unsynced or _pending_mutations > 0
+        _pending_mutations = 0
+        # Batch fsyncs: at most one per FSYNC_INTERVAL, and only after mutations
+        sync_due = unsynced and time.monotonic() - last_sync >= FSYNC_INTERVAL
+        flushed = await asyncio.to_thread(flush_memory, force_durable=sync_due)
+        if sync_due and flushed:
+            unsynced = False
+            last_sync = time.monotonic()
+        if compaction_due() and time.monotonic() >= next_compact:
+            try:
+                compacted = await compact_journal()
+            except Exception as e:
+                print(f"Failed to compact memory journal: {str(e)}")
+                compacted = False
+            if not compacted:
+                next_compact = time.monotonic() + COMPACT_RETRY_INTERVAL
+
+atexit.register(flush_memory, force_durable=True)
+
+def now_iso() -> str:
+    """Current local time as an ISO string, formatted at most once per second"""
+    global _last_sec, _last_iso
+    sec = int(time.time())
+    if sec != _last_sec:
+        _last_sec = sec
+        _last_iso = sys.intern(datetime.fromtimestamp(sec).isoformat())
+    return _last_iso
 
-def create_memory_entry(content: str):
+def generate_auto_key(now: str = None):
+    """Generate auto key from the given (or current) ISO time"""
+    if now is None:
+        now = now_iso()
+    return f"memory_{now[:19].translate(_KEY_STAMP_TABLE)}"
+
+def create_memory_entry(content: str, now: str = None):
     """Create memory entry with metadata"""
-    now = datetime.now().isoformat()
+    if now is None:
+        now = now_iso()
     return {
         "content": content,
         "created_at": now,
         "updated_at": now
     }
 
+def cache_entry_info(key: str, entry: dict):
+    """Precompute the fields list_memory shows for an entry"""
+    # Many entries share a date (and some a time), so keep one copy of each
+    created_at = entry["created_at"]
+    _entry_info[key] = (sys.intern(created_at[:10]), sys.intern(created_at[11:19]),
+                        len(entry["content"]))
+
+def normalize_entry(entry: dict):
+    """Share repeated strings on a loaded entry and drop stale derived fields"""
+    # Older files persisted the list fields; they are recomputed on load instead
+    for field in ("created_date", "created_time", "content_len"):
+        entry.pop(field, None)
+    # Never-updated entries were parsed into two equal timestamp strings
+    created_at = entry["created_at"]
+    if entry["updated_at"] == created_at:
+        entry["updated_at"] = created_at
+
+def preview_keys() -> str:
+    """List the first few keys for not-found messages"""
+    preview = ', '.join(itertools.islice(memory_store, KEY_PREVIEW_LIMIT))
+    if len(memory_store) > KEY_PREVIEW_LIMIT:
+        preview += ', ...'
+    return preview
+
 def log_operation(operation: str, key: str = None, before: dict = None, after: dict = None, 
                  success: bool = True, error: str = None, metadata: dict = None):
     """Log memory operations to jsonl file"""
     try:
-        log_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "operation_id": str(uuid.uuid4()),
-            "operation": operation,
-            "key": key,
-            "before": before,
-            "after": after,
-            "success": success,
-            "error": error,
-            "metadata": metadata or {}
-        }
-        
-        with open(LOG_FILE, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(log_entry, ensure_ascii=False) + '\n')
+        # Fields in _LOG_LINE order; encoding and writing happen on the log writer thread
+        log_entry = (time.time_ns(), f"{_pid}-{next(_op_counter)}", operation, key,
+                     before, after, success, error, metadata or {})
+        _log_q.put_nowait(log_entry)
+    except queue.Full:
+        print("Log queue full, dropping log entry.")
     except Exception as e:
         print(f"Failed to write log: {str(e)}")
 
+# Every log line has the same shape, so the keys and punctuation are baked in
+_LOG_LINE = (b'{"timestamp":%d,"operation_id":"%s","operation":"%s","key":%s,'
+             b'"before":%s,"after":%s,"success":%s,"error":%s,"metadata":%s}\n')
+
+# msgspec is fastest on these small values; the encoder is only used by the writer thread
+_encode_log_value = msgspec.json.Encoder().encode if msgspec is not None else dumps_json
+
+def _json_value(value) -> bytes:
+    """Encode one variable log field"""
+    return b'null' if value is None else _encode_log_value(value)
+
+def encode_log_entry(timestamp: int, operation_id: str, operation: str, key: str, before: dict,
+                     after: dict, success: bool, error: str, metadata: dict) -> bytes:
+    """Encode a log entry as one JSON line"""
+    # operation_id and operation are generated here and never need escaping
+    return _LOG_LINE % (timestamp, operation_id.encode(), operation.encode(), _json_value(key),
+                        _json_value(before), _json_value(after), b'true' if success else b'false',
+                        _json_value(error), _encode_log_value(metadata))
+
+def _log_worker():
+    """Drain the log queue, writing each batch of entries with one write"""
+    running = True
+    while running:
+        batch = [_log_q.get()]
+        while len(batch) < LOG_BATCH_SIZE:
+            try:
+                batch.append(_log_q.get_nowait())
+            except queue.Empty:
+                break
+        running = None not in batch  # None is the shutdown sentinel
+        try:
+            _LOG_FH.write(b''.join(
+                encode_log_entry(*log_entry) for log_entry in batch if log_entry is not None
+            ))
+            _LOG_FH.flush()
+        except Exception as e:
+            print(f"Failed to write log: {str(e)}")
+
+def stop_log_writer():
+    """Let the log writer finish queued entries before the process exits"""
+    _log_q.put(None)
+    _log_thread.join(timeout=5)
+
+_log_thread = threading.Thread(target=_log_worker, name="memory-log-writer", daemon=True)
+_log_thread.start()
+atexit.register(stop_log_writer)
+
 @mcp.tool()
 async def list_memory() -> str:
     """
@@ -84,17 +478,13 @@ async def list_memory() -> str:
         log_operation("list", metadata={"entry_count": len(memory_store)})
         
         if memory_store:
-            keys = list(memory_store.keys())
-            sorted_keys = sorted(keys, key=lambda k: memory_store[k]['created_at'], reverse=True)
-            result = f"🧠 {len(keys)} memory entries:\n\n"
-            for i, key in enumerate(sorted_keys, 1):
-                entry = memory_store[key]
-                created_date = entry['created_at'][:10]
-                created_time = entry['created_at'][11:19]
-                result += f"{i}. [{key}]\n"
-                result += f"   {entry['content']}\n"
-                result += f"   {created_date} {created_time} ({len(entry['content'])} chars)\n\n"
-            return result.rstrip()
+            parts = []
+            for i, (_, _, key) in enumerate(reversed(_sorted_index), 1):
+                created_date, created_time, content_len = _entry_info[key]
+                parts.append(f"{i}. [{key}]\n"
+                             f"   {memory_store[key]['content']}\n"
+                             f"   {created_date} {created_time} ({content_len} chars)\n\n")
+            return f"🧠 {len(memory_store)} memory entries:\n\n" + ''.join(parts).rstrip()
         else:
             return "No user info saved yet."
     except Exception as e:
@@ -129,23 +519,24 @@ async def create_memory(content: str) -> str:
         content: User info in "User is..." format.
     """
     try:
-        key = generate_auto_key()
+        now = now_iso()
+        key = generate_auto_key(now)
         original_key = key
         counter = 1
         while key in memory_store:
             key = f"{original_key}_{counter:02d}"
             counter += 1
         
-        new_entry = create_memory_entry(content)
+        new_entry = create_memory_entry(content, now)
         memory_store[key] = new_entry
+        index_add(key, new_entry)
+        cache_entry_info(key, new_entry)
+        append_journal("create", key, new_entry)
         
         log_operation("create", key=key, after=new_entry, 
                      metadata={"content_length": len(content), "auto_generated_key": key})
         
-        if save_memory_to_file():
-            return f"Saved: '{key}'"
-        else:
-            return "Saved in memory, file write failed."
+        return f"Saved: '{key}'"
     except Exception as e:
         log_operation("create", success=False, error=str(e), 
                      metadata={"attempted_content_length": len(content) if content else 0})
@@ -164,14 +555,13 @@ async def update_memory(key: str, content: str) -> str:
     try:
         if key not in memory_store:
             log_operation("update", key=key, success=False, error="Key not found")
-            available_keys = list(memory_store.keys())
-            if available_keys:
-                return f"Key '{key}' not found. Available: {', '.join(available_keys)}"
+            if memory_store:
+                return f"Key '{key}' not found. Available: {preview_keys()}"
             else:
                 return f"Key '{key}' not found. No memory data exists."
         
-        existing_entry = memory_store[key].copy()  # Make a copy for before state
-        now = datetime.now().isoformat()
+        existing_entry = memory_store[key]  # Replaced below, never mutated, so safe to log as-is
+        now = now_iso()
         
         updated_entry = {
             "content": content,
@@ -180,6 +570,8 @@ async def update_memory(key: str, content: str) -> str:
         }
         
         memory_store[key] = updated_entry
+        cache_entry_info(key, updated_entry)
+        append_journal("update", key, updated_entry)
         
         log_operation("update", key=key, before=existing_entry, after=updated_entry,
                      metadata={
@@ -188,10 +580,7 @@ async def update_memory(key: str, content: str) -> str:
                          "content_changed": existing_entry["content"] != content
                      })
         
-        if save_memory_to_file():
-            return f"Updated: '{key}'"
-        else:
-            return "Updated in memory, file write failed."
+        return f"Updated: '{key}'"
     except Exception as e:
         log_operation("update", key=key, success=False, error=str(e),
                      metadata={"attempted_content_length": len(content) if content else 0})
@@ -207,18 +596,18 @@ async def read_memory(key: str) -> str:
     try:
         if key in memory_store:
             entry = memory_store[key]
-            log_operation("read", key=key, metadata={"content_length": len(entry["content"])})
+            content_len = _entry_info[key][2]
+            log_operation("read", key=key, metadata={"content_length": content_len})
             return f"""Key: '{key}'
 {entry['content']}
 --- Metadata ---
 Created: {entry['created_at']}
 Updated: {entry['updated_at']}
-Chars: {len(entry['content'])}"""
+Chars: {content_len}"""
         else:
             log_operation("read", key=key, success=False, error="Key not found")
-            available_keys = list(memory_store.keys())
-            if available_keys:
-                return f"Key '{key}' not found. Available: {', '.join(available_keys)}"
+            if memory_store:
+                return f"Key '{key}' not found. Available: {preview_keys()}"
             else:
                 return f"Key '{key}' not found. No memory data."
     except Exception as e:
@@ -234,37 +623,48 @@ async def delete_memory(key: str) -> str:
     """
     try:
         if key in memory_store:
-            deleted_entry = memory_store[key].copy()  # Capture before deletion
+            deleted_entry = memory_store[key]  # Capture before deletion
             del memory_store[key]
+            index_remove(key, deleted_entry)
+            del _entry_info[key]
+            append_journal("delete", key)
             
             log_operation("delete", key=key, before=deleted_entry,
                          metadata={"deleted_content_length": len(deleted_entry["content"])})
             
-            if save_memory_to_file():
-                return f"Deleted '{key}'"
-            else:
-                return f"Deleted '{key}', file write failed."
+            return f"Deleted '{key}'"
         else:
             log_operation("delete", key=key, success=False, error="Key not found")
-            available_keys = list(memory_store.keys())
-            if available_keys:
-                return f"Key '{key}' not found. Available: {', '.join(available_keys)}"
+            if memory_store:
+                return f"Key '{key}' not found. Available: {preview_keys()}"
             else:
                 return f"Key '{key}' not found. No memory data."
     except Exception as e:
         log_operation("delete", key=key, success=False, error=str(e))
         return f"Failed to delete memory: {str(e)}"
 
+@mcp.tool()
+async def export_pretty() -> str:
+    """
+    Export all user info as indented JSON, e.g. for backup or manual review.
+    """
+    try:
+        log_operation("export", metadata={"entry_count": len(memory_store)})
+        return dumps_json(memory_store, indent=True).decode('utf-8')
+    except Exception as e:
+        log_operation("export", success=False, error=str(e))
+        return f"Failed to export memory: {str(e)}"
+
 @mcp.resource("memory://info")
 def get_memory_info() -> str:
     """Provide memory service info"""
-    total_chars = sum(len(entry['content']) for entry in memory_store.values())
+    total_chars = sum(info[2] for info in _entry_info.values())
     return (
         f"User Memory System Info:\n"
         f"- Entries: {len(memory_store)}\n"
         f"- Total chars: {total_chars}\n"
         f"- Data file: {MEMORY_FILE}\n"
-        f"- Tools: save_memory, read_memory, list_memory, delete_memory\n"
+        f"- Tools: save_memory, read_memory, list_memory, delete_memory, export_pretty\n"
         f"- Key format: memory_YYYYMMDDHHMMSS\n"
         f"- Save format: 'User is ...'\n"
     )